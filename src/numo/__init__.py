@@ -1,6 +1,7 @@
 """Numo package for numerical operations and conversions."""
 
 from numo.application.numo import Numo
+from numo.domain.models import Quantity
 
 __version__ = "0.2.5"
-__all__ = ["Numo"]
+__all__ = ["Numo", "Quantity"]
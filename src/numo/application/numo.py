@@ -1,4 +1,7 @@
-from typing import List, Optional, Callable, Any, Type
+import asyncio
+import weakref
+from collections import OrderedDict
+from typing import List, Optional, Callable, Any, Tuple, Type
 from numo.domain.interfaces.numo_manager import NumoManager
 from numo.domain.interfaces.numo_module import NumoModule
 from numo.infrastructure.managers import VariableManager, FunctionManager
@@ -9,6 +12,27 @@ from numo.infrastructure.modules import (
     MathModule,
     VariableModule,
 )
+from numo.services.file_service import FileService
+from numo.services.http_service import HttpService
+from numo.services.math_service import MathService
+from numo.services.persistent_cache_service import PersistentCacheService
+
+# Maximum number of preprocessed sources kept in the result cache
+_RESULT_CACHE_SIZE = 1024
+
+# Maximum number of expressions kept in the history file
+_HISTORY_SIZE = 256
+
+# Seconds a translation stays in the translation cache file
+_TRANSLATION_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+
+
+def _save_history(history_file: str, history: "OrderedDict[str, None]") -> None:
+    """Write the most recent math expressions to the history file."""
+    try:
+        FileService.write_json(history_file, list(history))
+    except OSError:
+        pass
 
 
 class Numo:
@@ -31,40 +55,118 @@ class Numo:
         >>> await numo.calculate("hello in spanish")  # Translation
     """
 
-    def __init__(self):
-        """Initialize Numo with default managers and modules."""
+    __slots__ = (
+        "_managers",
+        "_http_service",
+        "_translation_store",
+        "_modules",
+        "_result_cache",
+        "_history_file",
+        "_history",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        history_file: Optional[str] = None,
+        translation_cache_file: Optional[str] = None,
+    ):
+        """
+        Initialize Numo with default managers and modules.
+
+        Args:
+            history_file: Optional JSON file of previously seen math
+                expressions. They are compiled up front, and expressions
+                seen by this engine are written back when it is closed,
+                garbage collected, or at interpreter exit.
+            translation_cache_file: Optional SQLite file caching
+                translations for 30 days, shared between runs.
+        """
         self._managers: List[NumoManager] = [
             VariableManager(),
             FunctionManager(),
         ]
 
+        # Network modules share one HTTP session and its connection pool
+        self._http_service = HttpService()
+
+        self._translation_store: Optional[PersistentCacheService] = None
+        if translation_cache_file:
+            self._translation_store = PersistentCacheService(
+                translation_cache_file, ttl=_TRANSLATION_CACHE_TTL
+            )
+
         self._modules: List[NumoModule] = [
-            TranslateModule(),
+            TranslateModule(self._http_service, self._translation_store),
             UnitModule(),
-            CurrencyModule(),
+            CurrencyModule(self._http_service),
             MathModule(),
             VariableModule(),
         ]
 
-    async def calculate(self, lines: List[str]) -> List[Optional[str]]:
+        # Results of cacheable modules keyed by preprocessed source and rawness
+        self._result_cache: "OrderedDict[Tuple[str, bool], Any]" = OrderedDict()
+
+        # Math expressions seen by this engine, most recent last
+        self._history_file = history_file
+        self._history: "OrderedDict[str, None]" = OrderedDict()
+        if history_file:
+            self._load_history()
+            # Unlike atexit, a finalizer does not keep the engine alive
+            weakref.finalize(self, _save_history, history_file, self._history)
+
+    async def calculate(self, lines: List[str], *, raw: bool = False) -> List[Any]:
         """
         Process multiple lines of input through the Numo engine.
 
         Args:
             lines: List of input strings to process
+            raw: Return unformatted values (e.g. unrounded floats) instead
+                of display strings where modules support it
 
         Returns:
             List of results, None if processing failed
 
+        Raises:
+            TypeError: If any line is not a string
+
         Example:
             >>> results = await numo.calculate([
             ...     "x = 5",
             ...     "y = x * 2",
             ...     "y km to miles"
             ... ])
+            >>> await numo.calculate(["1 km to m"], raw=True)  # [Quantity(1000.0, "m")]
+        """
+        # Managers and modules rely on receiving strings
+        if not all(isinstance(line, str) for line in lines):
+            raise TypeError("lines must be a list of strings")
+
+        return await self._execute_modules(lines, raw)
+
+    async def aclose(self) -> None:
+        """
+        Release network resources held by the engine and write the
+        history file, if any. Call it on the event loop that ran the
+        calculations, so open connections are shut down cleanly.
+
+        Example:
+            >>> numo = Numo()
+            >>> await numo.calculate(["100 USD to EUR"])
+            >>> await numo.aclose()
         """
-        processed_sources = self._preprocess_input_lines(lines)
-        return await self._execute_modules(processed_sources)
+        if self._history_file:
+            _save_history(self._history_file, self._history)
+        await self._http_service.close()
+        if self._translation_store is not None:
+            self._translation_store.close()
+
+    async def __aenter__(self) -> "Numo":
+        """Use the engine as an async context manager that closes itself."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     def get_available_functions(self) -> List[str]:
         """
@@ -101,6 +203,23 @@ class Numo:
         )
         return variable_manager.get_available_variables()
 
+    def reset_variables(self) -> None:
+        """
+        Remove all user-defined variables.
+
+        Operator aliases and built-in constants remain available.
+
+        Example:
+            >>> numo = Numo()
+            >>> await numo.calculate(["x = 5"])
+            >>> numo.reset_variables()
+            >>> await numo.calculate(["x"])  # [None]
+        """
+        variable_manager = next(
+            m for m in self._managers if isinstance(m, VariableManager)
+        )
+        variable_manager.clear_variables()
+
     def get_available_modules(self) -> List[str]:
         """
         Get a list of all active modules.
@@ -131,46 +250,155 @@ class Numo:
         if isinstance(module, NumoModule):
             self._modules.append(module)
 
-    async def _execute_modules(self, sources: List[str]) -> List[Optional[str]]:
-        """Execute each source through available modules until a result is found."""
-        results = []
+    async def _execute_modules(self, lines: List[str], raw: bool) -> List[Any]:
+        """
+        Preprocess and execute all lines, keeping results in input order.
 
-        for source in sources:
-            if not source:
-                results.append(None)
-                continue
+        Lines are preprocessed one after another since variable definitions
+        affect later lines. Once preprocessed, a source no longer depends
+        on other lines, so all sources are executed concurrently. A line
+        whose execution raises keeps None as its result. Blank lines are
+        skipped before reaching the managers.
+        """
+        results: List[Any] = [None] * len(lines)
 
-            result = None
-            for module in self._modules:
-                module_result = await module.run(source)
-                if module_result:
-                    result = module_result
-                    break
-            if isinstance(result, float):
-                result = float(f"{result:.2f}")
-            results.append(result)
+        pending = []
+        for index, line in enumerate(lines):
+            if not line or line.isspace():
+                continue
+            source = self._preprocess_line(line)
+            if source:
+                pending.append(self._execute_source(index, source, results, raw))
 
+        await asyncio.gather(*pending, return_exceptions=True)
         return results
 
-    def _preprocess_input_lines(self, sources: List[str]) -> List[str]:
+    async def _execute_source(
+        self, index: int, source: str, results: List[Any], raw: bool
+    ) -> None:
+        """Execute a single source and store its result at the given index."""
+        if self._history_file:
+            self._remember(source)
+
+        cache_key = (source, raw)
+        if cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            result = self._result_cache[cache_key]
+        else:
+            result = await self._run_modules(source, raw)
+        if not raw and isinstance(result, float):
+            result = round(result, 2)
+        results[index] = result
+
+    async def _run_modules(self, source: str, raw: bool) -> Any:
         """
-        Preprocess input lines through all managers.
+        Run the modules that can handle a source concurrently.
+
+        Modules are first filtered with their cheap can_handle check, so
+        most sources reach a single module. Remaining modules run as
+        concurrent tasks, so network bound modules (translation, currency)
+        do not delay the others. Tasks are awaited in module order and
+        the first result wins, preserving module priority; lower priority
+        tasks still running are then cancelled. For raw results modules
+        are evaluated instead of run, and falsy values such as 0.0 count
+        as results.
+
+        Results of cacheable modules are stored by source. Variables and
+        function calls are already substituted at this point, so the
+        source alone determines the result.
+        """
+        candidates = [module for module in self._modules if module.can_handle(source)]
+        if not candidates:
+            return None
+
+        if len(candidates) == 1:
+            module = candidates[0]
+            result = await self._call_module(module, source, raw)
+            if not self._is_result(result, raw):
+                return None
+            if module.cacheable:
+                self._cache_result((source, raw), result)
+            return result
+
+        tasks = [
+            asyncio.ensure_future(self._call_module(module, source, raw))
+            for module in candidates
+        ]
+        try:
+            # A result is only reusable if no module ahead of it may change
+            # its answer over time
+            deterministic = True
+            for module, task in zip(candidates, tasks):
+                deterministic = deterministic and module.cacheable
+                result = await task
+                if self._is_result(result, raw):
+                    if deterministic:
+                        self._cache_result((source, raw), result)
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _is_result(result: Any, raw: bool) -> bool:
+        """Check if a module produced a result rather than declining."""
+        # Raw values are typed, so a zero is a valid result
+        return result is not None if raw else bool(result)
+
+    @staticmethod
+    async def _call_module(module: NumoModule, source: str, raw: bool) -> Any:
+        """Run or evaluate a module; a module that raises counts as None."""
+        try:
+            if raw:
+                return await module.evaluate(source)
+            return await module.run(source)
+        except Exception:
+            return None
+
+    def _remember(self, source: str) -> None:
+        """Record a math expression in the history."""
+        if not MathService.pattern.match(source):
+            return
+        self._history[source] = None
+        self._history.move_to_end(source)
+        if len(self._history) > _HISTORY_SIZE:
+            self._history.popitem(last=False)
+
+    def _load_history(self) -> None:
+        """Load the history file and compile its expressions ahead of time."""
+        try:
+            expressions = FileService.read_json(self._history_file)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(expressions, list):
+            return
+
+        for expression in expressions[-_HISTORY_SIZE:]:
+            if isinstance(expression, str) and MathService.precompile(expression):
+                self._history[expression] = None
+
+    def _cache_result(self, key: Tuple[str, bool], result: Any) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        self._result_cache[key] = result
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _preprocess_line(self, source: str) -> str:
+        """
+        Preprocess an input line through all managers.
 
         Args:
-            sources: List of raw input strings
+            source: Raw input string
 
         Returns:
-            List of preprocessed strings
+            Preprocessed string
         """
-        result = []
-
-        for source in sources:
-            processed_line = source.strip()
-            for manager in self._managers:
-                processed_line = manager.build(processed_line)
-            result.append(processed_line)
-
-        return result
+        processed_line = source.strip()
+        for manager in self._managers:
+            processed_line = manager.build(processed_line)
+        return processed_line
 
     def add_function(self, name: str, func: Callable[[List[str]], Any]) -> None:
         """
@@ -13,6 +13,8 @@ class NumoManager(ABC):
     - Input validation
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def build(self, source: str) -> str:
         """
@@ -19,8 +19,15 @@ class NumoModule(ABC):
     Important: Modules should never raise exceptions. They should return:
     - str: For successful operations
     - None: For any error or invalid input
+
+    Modules whose result depends only on the input string (no network,
+    no clock) may set `cacheable = True` so Numo can reuse their results.
     """
 
+    __slots__ = ()
+
+    cacheable: bool = False
+
     @abstractmethod
     async def run(self, source: str) -> Optional[str]:
         """
@@ -40,6 +47,47 @@ class NumoModule(ABC):
         """
         pass
 
+    async def evaluate(self, source: str) -> Any:
+        """
+        Execute the module's operation and return an unformatted value.
+
+        Numo calls this instead of run when raw results are requested.
+        Modules producing numbers override it to skip string formatting;
+        the default returns the result of run.
+
+        Args:
+            source: Preprocessed input string ready for execution
+
+        Returns:
+            Any: Result value (e.g. float) if successful
+            None: For any error or invalid input
+
+        Example:
+            >>> module = UnitModule()
+            >>> await module.evaluate("1 km to m")  # Returns 1000.0
+        """
+        return await self.run(source)
+
+    def can_handle(self, source: str) -> bool:
+        """
+        Cheaply check whether the input has the shape this module handles.
+
+        Numo only runs modules that can handle a source. Override this with
+        a quick pattern check; the default accepts every input.
+
+        Args:
+            source: Preprocessed input string
+
+        Returns:
+            bool: False if run would certainly return None, True otherwise
+
+        Example:
+            >>> module = MathModule()
+            >>> module.can_handle("1 + 2")  # Returns True
+            >>> module.can_handle("hello in spanish")  # Returns False
+        """
+        return True
+
     def _format_result(self, value: Any) -> Optional[str]:
         """
         Safely format any value to string or None.
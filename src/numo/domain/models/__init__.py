@@ -0,0 +1,5 @@
+"""Value types for the Numo package."""
+
+from .quantity import Quantity
+
+__all__ = ["Quantity"]
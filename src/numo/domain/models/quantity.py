@@ -0,0 +1,21 @@
+from typing import NamedTuple
+
+
+class Quantity(NamedTuple):
+    """
+    A numeric value with its unit, returned by conversions in raw mode.
+
+    Example:
+        >>> quantity = Quantity(1000.0, "m")
+        >>> quantity.value  # 1000.0
+        >>> str(quantity)  # "1000.0 m"
+    """
+
+    value: float
+    unit: str
+
+    def __str__(self) -> str:
+        return f"{self.value} {self.unit}"
+
+    def __float__(self) -> float:
+        return self.value
@@ -4,6 +4,14 @@ import math
 from numo.domain.interfaces.numo_manager import NumoManager
 import statistics
 
+# Function call with its raw argument list, e.g. "sum(1, 2, 3)"
+_FUNCTION_PATTERN = re.compile(r"(\w+)\((.*?)\)")
+
+
+def _floats(params: List[str]) -> List[float]:
+    """Convert all string arguments to floats in a single pass."""
+    return list(map(float, params))
+
 
 class FunctionManager(NumoManager):
     """
@@ -11,9 +19,10 @@ class FunctionManager(NumoManager):
     Manages function registration and execution.
     """
 
+    __slots__ = ("_functions",)
+
     def __init__(self):
-        """Initialize with function registry and pattern."""
-        self._pattern = r"(\w+)\((.*?)\)"
+        """Initialize with function registry."""
         self._functions: Dict[str, Callable[[List[str]], Any]] = {}
         self._initialize_functions()
 
@@ -33,11 +42,11 @@ class FunctionManager(NumoManager):
             >>> manager.build("sum(1, 2, 3)")  # Returns "6"
             >>> manager.build("invalid()")     # Returns "invalid()"
         """
-        if not source or not isinstance(source, str):
+        if not source:
             return source
 
         # Find all function calls
-        matches = list(re.finditer(self._pattern, source))
+        matches = list(_FUNCTION_PATTERN.finditer(source))
         if not matches:
             return source
 
@@ -96,14 +105,14 @@ class FunctionManager(NumoManager):
             "floor": lambda params: math.floor(float(params[0])),
             "ceil": lambda params: math.ceil(float(params[0])),
             # Statistical Functions
-            "sum": lambda params: sum(float(p) for p in params),
-            "avg": lambda params: sum(float(p) for p in params) / len(params),
-            "mean": lambda params: sum(float(p) for p in params) / len(params),
-            "min": lambda params: min(float(p) for p in params),
-            "max": lambda params: max(float(p) for p in params),
-            "median": lambda params: sorted(float(p) for p in params)[len(params) // 2],
-            "var": lambda params: statistics.variance([float(p) for p in params]),
-            "std": lambda params: statistics.stdev([float(p) for p in params]),
+            "sum": lambda params: sum(_floats(params)),
+            "avg": lambda params: sum(_floats(params)) / len(params),
+            "mean": lambda params: sum(_floats(params)) / len(params),
+            "min": lambda params: min(_floats(params)),
+            "max": lambda params: max(_floats(params)),
+            "median": lambda params: sorted(_floats(params))[len(params) // 2],
+            "var": lambda params: statistics.variance(_floats(params)),
+            "std": lambda params: statistics.stdev(_floats(params)),
             # Trigonometric Functions
             "sin": lambda params: math.sin(float(params[0])),
             "cos": lambda params: math.cos(float(params[0])),
@@ -122,15 +131,11 @@ class FunctionManager(NumoManager):
             "gcd": lambda params: math.gcd(int(params[0]), int(params[1])),
             "mod": lambda params: float(params[0]) % float(params[1]),
             # Advanced Statistical Functions
-            "mode": lambda params: statistics.mode([float(p) for p in params]),
-            "harmonic_mean": lambda params: statistics.harmonic_mean(
-                [float(p) for p in params]
-            ),
-            "geometric_mean": lambda params: statistics.geometric_mean(
-                [float(p) for p in params]
-            ),
+            "mode": lambda params: statistics.mode(_floats(params)),
+            "harmonic_mean": lambda params: statistics.harmonic_mean(_floats(params)),
+            "geometric_mean": lambda params: statistics.geometric_mean(_floats(params)),
             "percentile": lambda params: statistics.quantiles(
-                [float(p) for p in params[1:]], n=100
+                _floats(params[1:]), n=100
             )[int(params[0]) - 1],
             # Range Functions
             "clamp": lambda params: max(
@@ -1,6 +1,70 @@
+from decimal import Decimal
 from typing import Dict, Optional, Tuple
 from numo.domain.interfaces.numo_manager import NumoManager
+from numo.services.math_service import MathService
 import math
+import re
+
+# Identifiers that may reference a variable; names directly followed by "("
+# are function calls and are left for the function manager. Parts of words
+# joined to a letter by "-", "." or "'" ("e-mail", "e.g.", "don't") are
+# ordinary text, while "x-1" is still math.
+_REFERENCE_PATTERN = re.compile(
+    r"(?<![^\W\d][-.'])\b[^\W\d]\w*\b(?!\(|[-.'][^\W\d])"
+)
+
+# Variable definition: a valid name, "=" or ":=", and a value
+_DEFINITION_PATTERN = re.compile(r"^([^\W\d]\w*)\s*(:=|=)\s*(.+)$")
+
+# Mathematical operator aliases
+_OPERATORS = {
+    "+": ["plus", "add"],
+    "-": ["minus", "subtract"],
+    "*": ["multiply", "times"],
+    "/": ["divide", "division"],
+    "%": ["mod", "modulus"],
+    "^": ["power", "exponent"],
+}
+
+
+def _build_builtin_variables() -> Dict[str, str]:
+    """Build the operator aliases and mathematical constants table."""
+    variables: Dict[str, str] = {}
+
+    # Initialize operators and their aliases
+    for operator, aliases in _OPERATORS.items():
+        # Store operator itself
+        variables[operator] = operator
+        # Store all aliases
+        for alias in aliases:
+            variables[alias.lower()] = operator
+
+    # Mathematical constants
+    variables.update(
+        {
+            # Basic mathematical constants
+            "pi": str(math.pi),
+            "e": str(math.e),
+            "tau": str(math.tau),  # 2π
+            # Common fractions as decimals
+            "phi": str((1 + math.sqrt(5)) / 2),  # Golden ratio
+            "sqrt2": str(math.sqrt(2)),
+            "sqrt3": str(math.sqrt(3)),
+            # Common angles in radians
+            "deg30": str(math.pi / 6),
+            "deg45": str(math.pi / 4),
+            "deg60": str(math.pi / 3),
+            "deg90": str(math.pi / 2),
+            "deg180": str(math.pi),
+            "deg360": str(2 * math.pi),
+        }
+    )
+
+    return variables
+
+
+# Built once at import; every manager starts from a copy
+_BUILTIN_VARIABLES = _build_builtin_variables()
 
 
 class VariableManager(NumoManager):
@@ -12,23 +76,11 @@ class VariableManager(NumoManager):
     3. Mathematical operator aliases
     """
 
-    def __init__(self):
-        """Initialize variable storage and operator aliases."""
-        # Variable storage
-        self._variables: Dict[str, str] = {}
-
-        # Mathematical operator aliases
-        self._operators = {
-            "+": ["plus", "add"],
-            "-": ["minus", "subtract"],
-            "*": ["multiply", "times"],
-            "/": ["divide", "division"],
-            "%": ["mod", "modulus"],
-            "^": ["power", "exponent"],
-        }
+    __slots__ = ("_variables",)
 
-        # Initialize operator aliases
-        self._initialize_operators()
+    def __init__(self):
+        """Initialize variable storage with operator aliases and constants."""
+        self._variables: Dict[str, str] = dict(_BUILTIN_VARIABLES)
 
     def build(self, source: str) -> str:
         """
@@ -52,7 +104,7 @@ class VariableManager(NumoManager):
             >>> manager.build("x plus 3")      # Returns "5 + 3"
             >>> manager.build("y times 2")     # Returns "y * 2" (y not defined)
         """
-        if not source or not isinstance(source, str):
+        if not source:
             return source
 
         # First check if it's a variable definition
@@ -74,27 +126,33 @@ class VariableManager(NumoManager):
         Returns:
             Tuple of (is_definition, processed_source)
         """
-        # Check for assignment operators
-        for op in ["=", ":="]:
-            if op in source:
-                parts = source.split(op, 1)
-                if len(parts) == 2:
-                    name = parts[0].strip()
-                    value = parts[1].strip()
-
-                    # Validate variable name
-                    if not self._is_valid_name(name):
-                        return False, source
-
-                    # Process value for any existing variable references
-                    processed_value = self._process_references(value)
-
-                    # Store the variable
-                    self._variables[name.lower()] = processed_value
-
-                    return True, f"{name} {op} {processed_value}"
-
-        return False, source
+        match = _DEFINITION_PATTERN.match(source)
+        if not match:
+            return False, source
+
+        name, op, value = match.groups()
+
+        # Process value for any existing variable references
+        processed_value = self._process_references(value)
+
+        # Resolve arithmetic once, so later references substitute a single
+        # number and keep their precedence ("x = 2 + 3" then "x * 2")
+        evaluated = MathService.safe_eval(processed_value)
+        if evaluated is not None:
+            # Keep whole numbers integral so int-taking functions accept them,
+            # and avoid exponent notation ("1e-05"), which is not valid math
+            value_text = (
+                str(int(evaluated))
+                if evaluated.is_integer()
+                else format(Decimal(repr(evaluated)), "f")
+            )
+            # Parenthesize negatives so "x ^ 2" squares the whole value
+            processed_value = f"({value_text})" if evaluated < 0 else value_text
+
+        # Store the variable
+        self._variables[name.lower()] = processed_value
+
+        return True, f"{name} {op} {processed_value}"
 
     def _process_references(self, source: str) -> str:
         """
@@ -106,70 +164,16 @@ class VariableManager(NumoManager):
         Returns:
             Processed source with references/aliases replaced
         """
-        tokens = source.split()
-        processed = []
-
-        for token in tokens:
-            # Try to replace variable or operator
-            lower_token = token.lower()
-            if lower_token in self._variables:
-                processed.append(self._variables[lower_token])
-            else:
-                processed.append(token)
-
-        return " ".join(processed)
-
-    def _is_valid_name(self, name: str) -> bool:
-        """
-        Validate variable name.
+        return _REFERENCE_PATTERN.sub(self._replace_reference, source)
 
-        Args:
-            name: Variable name to validate
-
-        Returns:
-            True if name is valid, False otherwise
-        """
-        # Must be a string and not empty
-        if not name or not isinstance(name, str):
-            return False
-
-        # Must start with letter or underscore
-        if not name[0].isalpha() and name[0] != "_":
-            return False
-
-        # Rest must be alphanumeric or underscore
-        return all(c.isalnum() or c == "_" for c in name[1:])
-
-    def _initialize_operators(self) -> None:
-        """Initialize mathematical operator aliases and constants."""
-        # Initialize operators and their aliases
-        for operator, aliases in self._operators.items():
-            # Store operator itself
-            self._variables[operator] = operator
-            # Store all aliases
-            for alias in aliases:
-                self._variables[alias.lower()] = operator
-
-        # Mathematical constants
-        self._variables.update(
-            {
-                # Basic mathematical constants
-                "pi": str(math.pi),
-                "e": str(math.e),
-                "tau": str(math.tau),  # 2π
-                # Common fractions as decimals
-                "phi": str((1 + math.sqrt(5)) / 2),  # Golden ratio
-                "sqrt2": str(math.sqrt(2)),
-                "sqrt3": str(math.sqrt(3)),
-                # Common angles in radians
-                "deg30": str(math.pi / 6),
-                "deg45": str(math.pi / 4),
-                "deg60": str(math.pi / 3),
-                "deg90": str(math.pi / 2),
-                "deg180": str(math.pi),
-                "deg360": str(2 * math.pi),
-            }
-        )
+    def _replace_reference(self, match: re.Match) -> str:
+        """Return the value of a matched variable or operator alias."""
+        token = match.group(0)
+        # Keys are stored lowercased; only lower tokens that need it
+        value = self._variables.get(token)
+        if value is None and not token.islower():
+            value = self._variables.get(token.lower())
+        return token if value is None else value
 
     def get_variable(self, name: str) -> Optional[str]:
         """
@@ -184,14 +188,8 @@ class VariableManager(NumoManager):
         return self._variables.get(name.lower())
 
     def clear_variables(self) -> None:
-        """Clear all user variables but keep operator aliases."""
-        # Keep only operator aliases
-        operators = {
-            name: value
-            for name, value in self._variables.items()
-            if any(value == op for op in self._operators.keys())
-        }
-        self._variables = operators
+        """Clear all user variables but keep operator aliases and constants."""
+        self._variables = dict(_BUILTIN_VARIABLES)
 
     def get_available_variables(self) -> list[str]:
         """
@@ -1,8 +1,18 @@
 import re
+import time
+from datetime import date
 from typing import Optional, Dict
-import aiohttp
 from numo.domain.interfaces.numo_module import NumoModule
-import time
+from numo.domain.models import Quantity
+from numo.services.cache_service import CacheService
+from numo.services.http_service import HttpService
+
+_CURRENCY_PATTERN = re.compile(
+    r"^(\d+(?:\.\d+)?)\s*([A-Za-z]{3})\s*to\s*([A-Za-z]{3})$", re.IGNORECASE
+)
+
+# Seconds to wait after a failed rate request before trying again
+_RETRY_DELAY = 60
 
 
 class CurrencyModule(NumoModule):
@@ -12,13 +22,32 @@ class CurrencyModule(NumoModule):
     Includes caching mechanism to optimize API usage.
     """
 
-    def __init__(self):
-        """Initialize with currency pattern and API settings."""
-        self._pattern = r"^(\d+(?:\.\d+)?)\s*([A-Za-z]{3})\s*to\s*([A-Za-z]{3})$"
+    __slots__ = (
+        "_http_service",
+        "_api_url",
+        "_rates",
+        "_cache_duration",
+        "_rates_cache",
+        "_retry_at",
+    )
+
+    def __init__(self, http_service: Optional[HttpService] = None):
+        """
+        Initialize with API settings.
+
+        Args:
+            http_service: Shared HTTP service; a private one is created if omitted
+        """
+        self._http_service = http_service or HttpService()
         self._api_url = "https://api.exchangerate-api.com/v4/latest/USD"
         self._rates: Dict[str, float] = {}
-        self._last_update = 0
         self._cache_duration = 24 * 60 * 60  # 24 hours in seconds
+        self._rates_cache = CacheService(ttl=self._cache_duration, maxsize=1)
+        self._retry_at = 0.0
+
+    def can_handle(self, source: str) -> bool:
+        """Check if the input looks like "amount CUR to CUR"."""
+        return _CURRENCY_PATTERN.match(source) is not None
 
     async def run(self, source: str) -> Optional[str]:
         """
@@ -36,11 +65,25 @@ class CurrencyModule(NumoModule):
             >>> await module.run("100 USD to EUR")  # Returns "85.23 EUR"
             >>> await module.run("invalid")  # Returns None
         """
-        if not source or not isinstance(source, str):
+        result = await self.evaluate(source)
+        if result is None:
+            return None
+
+        return self._format_result(result.value, result.unit)
+
+    async def evaluate(self, source: str) -> Optional[Quantity]:
+        """
+        Convert amount between currencies and return the unformatted value.
+
+        Example:
+            >>> module = CurrencyModule()
+            >>> await module.evaluate("100 USD to EUR")  # Quantity(85.23..., "EUR")
+        """
+        if not source:
             return None
 
         # Parse conversion request
-        match = re.match(self._pattern, source, re.IGNORECASE)
+        match = _CURRENCY_PATTERN.match(source)
         if not match:
             return None
 
@@ -63,50 +106,56 @@ class CurrencyModule(NumoModule):
         try:
             # Convert amount
             result = amount * (rates[to_curr] / rates[from_curr])
-            return self._format_result(result, to_curr)
+            return Quantity(result, to_curr)
         except (ValueError, ZeroDivisionError):
             return None
 
     async def _get_exchange_rates(self) -> Optional[Dict[str, float]]:
+        """
+        Get current exchange rates.
+        Uses cached rates if they are still valid; concurrent conversions
+        share a single API request. Rates are published daily, so the
+        cache is keyed by date and refreshed once the day changes.
+        Falls back to the last known rates.
+
+        Returns:
+            dict: Exchange rates if successful
+            None: For any error
+        """
+        rates = await self._rates_cache.get_or_create(
+            (self._api_url, date.today()), self._fetch_exchange_rates
+        )
+        if rates:
+            self._rates = rates
+            return rates
+
+        # Return last known rates if available, otherwise None
+        return self._rates if self._rates else None
+
+    async def _fetch_exchange_rates(self) -> Optional[Dict[str, float]]:
         """
         Fetch current exchange rates from API.
-        Uses cached rates if they are still valid.
+
+        After a failed request no further requests are made for a while,
+        so a batch of conversions while offline makes a single attempt
+        instead of one per line.
 
         Returns:
             dict: Exchange rates if successful
             None: For any error
         """
-        current_time = time.time()
+        if time.monotonic() < self._retry_at:
+            return None
 
-        # Use cached data if still valid
-        if self._rates and (current_time - self._last_update) < self._cache_duration:
-            return self._rates
+        data = await self._http_service.get_json(self._api_url)
+        rates = data.get("rates") if isinstance(data, dict) else None
+        if not rates or not isinstance(rates, dict):
+            self._retry_at = time.monotonic() + _RETRY_DELAY
+            return None
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self._api_url) as response:
-                    if response.status != 200:
-                        return self._rates if self._rates else None
-
-                    data = await response.json()
-                    if not data or "rates" not in data:
-                        return self._rates if self._rates else None
-
-                    rates = data["rates"]
-                    if not isinstance(rates, dict):
-                        return self._rates if self._rates else None
-
-                    # Add base currency
-                    rates["USD"] = 1.0
-
-                    # Update cache
-                    self._rates = rates
-                    self._last_update = current_time
-                    return rates
-
-        except (aiohttp.ClientError, ValueError, KeyError):
-            # Return cached rates if available, otherwise None
-            return self._rates if self._rates else None
+        # Add base currency
+        rates["USD"] = 1.0
+        return rates
 
     def _format_result(self, value: float, currency: str) -> str:
         """Format currency amount with 2 decimal places and currency code."""
@@ -15,6 +15,14 @@ class MathModule(NumoModule):
     - Protection against dangerous operations
     """
 
+    __slots__ = ()
+
+    cacheable = True
+
+    def can_handle(self, source: str) -> bool:
+        """Check if the input contains only numbers and operators."""
+        return MathService.pattern.match(source) is not None
+
     async def run(self, source: str) -> Optional[str]:
         """
         Safely evaluate a mathematical expression.
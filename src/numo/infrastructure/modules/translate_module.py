@@ -1,9 +1,16 @@
 import re
 from typing import Optional
-import aiohttp
 from numo.domain.interfaces.numo_module import NumoModule
+from numo.services.cache_service import CacheService
+from numo.services.http_service import HttpService
+from numo.services.persistent_cache_service import PersistentCacheService
 from numo.infrastructure.modules.languages import languages
 
+_TRANSLATE_PATTERN = re.compile(r"^(.+?)\s+in\s+([a-zA-Z-]+)$", re.IGNORECASE)
+
+# Lowercased language names mapped to their codes
+_NAME_TO_CODE = {name.lower(): code for code, name in languages.items()}
+
 
 class TranslateModule(NumoModule):
     """
@@ -12,19 +19,35 @@ class TranslateModule(NumoModule):
     Supports multiple languages and automatic language detection.
     """
 
-    def __init__(self):
-        """Initialize with translation pattern and language codes."""
-        self._pattern = r"^(.+?)\s+in\s+([a-zA-Z-]+)$"
+    __slots__ = (
+        "_http_service",
+        "_languages",
+        "_api_url",
+        "_translations",
+        "_translation_store",
+    )
+
+    def __init__(
+        self,
+        http_service: Optional[HttpService] = None,
+        translation_store: Optional[PersistentCacheService] = None,
+    ):
+        """
+        Initialize with language codes and API settings.
+
+        Args:
+            http_service: Shared HTTP service; a private one is created if omitted
+            translation_store: Optional on-disk cache consulted before the API
+        """
+        self._http_service = http_service or HttpService()
         self._languages = languages
         self._api_url = "https://translate.googleapis.com/translate_a/single"
+        self._translations = CacheService(ttl=60 * 60)  # 1 hour in seconds
+        self._translation_store = translation_store
 
-    def _is_valid_language(self, lang_code: str) -> bool:
-        """Check if a language code is supported."""
-        lang_code = lang_code.lower()
-        for code, name in self._languages.items():
-            if lang_code in name.lower() or name.lower() in lang_code:
-                return True
-        return lang_code in self._languages
+    def can_handle(self, source: str) -> bool:
+        """Check if the input looks like "text in language"."""
+        return _TRANSLATE_PATTERN.match(source) is not None
 
     async def run(self, source: str) -> Optional[str]:
         """
@@ -42,28 +65,27 @@ class TranslateModule(NumoModule):
             >>> await module.run('hello in spanish')  # Returns "hola"
             >>> await module.run('invalid')  # Returns None
         """
-        if not source or not isinstance(source, str):
+        if not source:
             return None
 
         # Parse translation request
-        match = re.match(self._pattern, source, re.IGNORECASE)
+        match = _TRANSLATE_PATTERN.match(source)
         if not match:
             return None
 
         text = match.group(1)
         to_lang = match.group(2).lower()
 
-        # Validate language
-        if not self._is_valid_language(to_lang):
-            return None
-
-        # Get language code
+        # Validate language and get its code
         target_lang = self._get_language_code(to_lang)
         if not target_lang:
             return None
 
         # Perform translation
-        translated = await self._translate_text(text, "auto", target_lang)
+        translated = await self._translations.get_or_create(
+            (text, target_lang),
+            lambda: self._lookup_translation(text, target_lang),
+        )
         if translated:
             return translated.lower()
         return None
@@ -74,12 +96,39 @@ class TranslateModule(NumoModule):
         # If it's already a code
         if language in self._languages:
             return language
-        # If it's a language name (partial match)
-        for code, name in self._languages.items():
-            if language in name.lower() or name.lower() in language:
+        # If it's a language name
+        code = _NAME_TO_CODE.get(language)
+        if code is not None:
+            return code
+        # If it's part of a language name (e.g. "chinese")
+        for name, code in _NAME_TO_CODE.items():
+            if language in name or name in language:
                 return code
         return None
 
+    async def _lookup_translation(self, text: str, to_lang: str) -> Optional[str]:
+        """
+        Get a translation from the on-disk store, or translate and store it.
+
+        Args:
+            text: Text to translate
+            to_lang: Target language code
+
+        Returns:
+            str: Translated text if successful
+            None: For any error
+        """
+        if self._translation_store is None:
+            return await self._translate_text(text, "auto", to_lang)
+
+        key = f"{to_lang}:{text}"
+        translated = await self._translation_store.get(key)
+        if translated is None:
+            translated = await self._translate_text(text, "auto", to_lang)
+            if translated:
+                await self._translation_store.set(key, translated)
+        return translated
+
     async def _translate_text(
         self, text: str, from_lang: str, to_lang: str
     ) -> Optional[str]:
@@ -95,31 +144,26 @@ class TranslateModule(NumoModule):
             str: Translated text if successful
             None: For any error
         """
+        params = {
+            "client": "gtx",
+            "sl": from_lang,
+            "tl": to_lang,
+            "dt": "t",
+            "q": text,
+        }
+
+        data = await self._http_service.get_json(self._api_url, params=params)
+        if not data or not isinstance(data, list):
+            return None
+
         try:
-            params = {
-                "client": "gtx",
-                "sl": from_lang,
-                "tl": to_lang,
-                "dt": "t",
-                "q": text,
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self._api_url, params=params) as response:
-                    if response.status != 200:
-                        return None
-
-                    data = await response.json()
-                    if not data or not isinstance(data, list):
-                        return None
-
-                    # Extract translated text from response
-                    translated = ""
-                    for item in data[0]:
-                        if item and isinstance(item, list) and len(item) > 0:
-                            translated += item[0]
-
-                    return translated if translated else None
-
-        except (aiohttp.ClientError, ValueError, KeyError, IndexError):
+            # Extract translated text from response
+            translated = ""
+            for item in data[0]:
+                if item and isinstance(item, list) and len(item) > 0:
+                    translated += item[0]
+
+            return translated if translated else None
+
+        except (TypeError, KeyError, IndexError):
             return None
@@ -1,6 +1,7 @@
 import re
 from typing import Dict, Optional, Any
 from numo.domain.interfaces.numo_module import NumoModule
+from numo.domain.models import Quantity
 from numo.infrastructure.modules.units import (
     angular_units,
     area_units,
@@ -12,6 +13,44 @@ from numo.infrastructure.modules.units import (
     weight_units,
 )
 
+_UNIT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([a-zA-Z]+)\s*to\s*([a-zA-Z]+)")
+
+# Unit collections by dimension, in lookup priority order
+_UNIT_COLLECTIONS = {
+    "angular": angular_units,
+    "area": area_units,
+    "length": length_units,
+    "speed": speed_units,
+    "storage": storage_units,
+    "time": time_units,
+    "volume": volume_units,
+    "weight": weight_units,
+}
+
+
+def _build_conversion_factors() -> Dict[str, Dict[str, float]]:
+    """
+    Map every unit phrase to its conversion factor in each dimension.
+
+    A phrase may name units of several dimensions ("m" is both meter and
+    mach), so factors are kept per dimension instead of letting the last
+    collection overwrite the others.
+    """
+    factors: Dict[str, Dict[str, float]] = {}
+    for dimension, collection in _UNIT_COLLECTIONS.items():
+        for unit_data in collection.values():
+            try:
+                factor = float(unit_data["unit"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            for phrase in unit_data["phrases"]:
+                factors.setdefault(phrase.lower(), {})[dimension] = factor
+    return factors
+
+
+# Built once at import and shared by every module instance
+_CONVERSION_FACTORS = _build_conversion_factors()
+
 
 class UnitModule(NumoModule):
     """
@@ -20,33 +59,13 @@ class UnitModule(NumoModule):
     Supports length, weight, area, volume, speed, time, and digital storage units.
     """
 
-    def __init__(self):
-        """Initialize with conversion factors."""
-        self._pattern = r"(\d+(?:\.\d+)?)\s*([a-zA-Z]+)\s*to\s*([a-zA-Z]+)"
-        self._conversion_factors: Dict[str, float] = {}
-        self._initialize_conversion_factors()
-
-    def _initialize_conversion_factors(self) -> None:
-        """Initialize conversion factors from all unit types."""
-        unit_collections = [
-            angular_units,
-            area_units,
-            length_units,
-            speed_units,
-            storage_units,
-            time_units,
-            volume_units,
-            weight_units,
-        ]
-
-        for collection in unit_collections:
-            for unit_data in collection.values():
-                for phrase in unit_data["phrases"]:
-                    try:
-                        factor = float(unit_data["unit"])
-                        self._conversion_factors[phrase.lower()] = factor
-                    except:
-                        continue
+    __slots__ = ()
+
+    cacheable = True
+
+    def can_handle(self, source: str) -> bool:
+        """Check if the input looks like "value unit_from to unit_to"."""
+        return _UNIT_PATTERN.match(source) is not None
 
     async def run(self, source: str) -> Optional[str]:
         """
@@ -64,10 +83,24 @@ class UnitModule(NumoModule):
             >>> await module.run("5 km to miles")  # Returns "3.10686"
             >>> await module.run("1 kg to pounds")  # Returns "2.20462"
         """
-        if not source or not isinstance(source, str):
+        result = await self.evaluate(source)
+        if result is None:
             return None
 
-        match = re.match(self._pattern, source)
+        return self._format_result(result.value)
+
+    async def evaluate(self, source: str) -> Optional[Quantity]:
+        """
+        Convert between units and return the unformatted value.
+
+        Example:
+            >>> module = UnitModule()
+            >>> await module.evaluate("1 km to m")  # Returns Quantity(1000.0, "m")
+        """
+        if not source:
+            return None
+
+        match = _UNIT_PATTERN.match(source)
         if not match:
             return None
 
@@ -81,8 +114,7 @@ class UnitModule(NumoModule):
         result = self._convert_units(amount, from_unit, to_unit)
         if result is None:
             return None
-
-        return self._format_result(result)
+        return Quantity(result, to_unit)
 
     def _convert_units(
         self, value: float, from_unit: str, to_unit: str
@@ -99,31 +131,30 @@ class UnitModule(NumoModule):
             float: Converted value if possible
             None: For any error or invalid input
         """
-        from_factor = self._get_conversion_factor(from_unit)
-        if from_factor is None:
-            return None
-
-        to_factor = self._get_conversion_factor(to_unit)
-        if to_factor is None or to_factor == 0:
+        from_factors = self._get_conversion_factors(from_unit)
+        to_factors = self._get_conversion_factors(to_unit)
+        if not from_factors or not to_factors:
             return None
 
-        try:
-            return value * (from_factor / to_factor)
-        except (ValueError, ZeroDivisionError):
-            return None
+        # Convert within the first dimension both units belong to
+        for dimension, from_factor in from_factors.items():
+            to_factor = to_factors.get(dimension)
+            if to_factor:
+                return value * (from_factor / to_factor)
+        return None
 
-    def _get_conversion_factor(self, unit: str) -> Optional[float]:
+    def _get_conversion_factors(self, unit: str) -> Optional[Dict[str, float]]:
         """
-        Get conversion factor for a unit.
+        Get conversion factors for a unit.
 
         Args:
             unit: Unit name to look up
 
         Returns:
-            float: Conversion factor if unit exists
+            dict: Conversion factor per dimension if unit exists
             None: For any error or invalid unit
         """
-        return self._conversion_factors.get(unit.lower())
+        return _CONVERSION_FACTORS.get(unit.lower())
 
     def _format_result(self, value: float) -> str:
         """Format the result as a string with two decimal places."""
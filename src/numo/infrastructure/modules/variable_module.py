@@ -1,8 +1,10 @@
 import re
-from typing import Optional
+from typing import Optional, Union
 from numo.services.math_service import MathService
 from numo.domain.interfaces.numo_module import NumoModule
 
+_VARIABLE_PATTERN = re.compile(r"(\w+)\s*(?::=|[:=])\s*(.+)")
+
 
 class VariableModule(NumoModule):
     """
@@ -11,9 +13,13 @@ class VariableModule(NumoModule):
     Supports various assignment formats and value processing.
     """
 
-    def __init__(self):
-        """Initialize with variable pattern."""
-        self._pattern = r"(\w+)\s*[:=]\s*(.+)"
+    __slots__ = ()
+
+    cacheable = True
+
+    def can_handle(self, source: str) -> bool:
+        """Check if the input looks like a variable assignment."""
+        return _VARIABLE_PATTERN.match(source) is not None
 
     async def run(self, source: str) -> Optional[str]:
         """
@@ -25,7 +31,18 @@ class VariableModule(NumoModule):
         Returns:
             Optional[str]: Variable value if successful, None if failed
         """
-        match = re.match(self._pattern, source)
+        return self._format_result(await self.evaluate(source))
+
+    async def evaluate(self, source: str) -> Optional[Union[float, str]]:
+        """
+        Evaluate the assigned value without formatting it.
+
+        Returns:
+            float: If the value is a mathematical expression
+            str: The value as written otherwise
+            None: If the source is not an assignment
+        """
+        match = _VARIABLE_PATTERN.match(source)
         if not match:
             return None
 
@@ -33,5 +50,5 @@ class VariableModule(NumoModule):
         variable_value = match.group(2)
         processed_value = MathService.safe_eval(variable_value)
         if processed_value is not None:
-            return str(processed_value)
+            return processed_value
         return variable_value
@@ -4,5 +4,8 @@ This layer acts as a bridge between infrastructure and domain layers.
 """
 
 from .math_service import MathService
+from .http_service import HttpService
+from .cache_service import CacheService
+from .persistent_cache_service import PersistentCacheService
 
-__all__ = ["MathService"]
+__all__ = ["MathService", "HttpService", "CacheService", "PersistentCacheService"]
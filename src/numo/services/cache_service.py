@@ -0,0 +1,113 @@
+"""In-memory caching service for the Numo engine."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CacheService:
+    """
+    Service for caching values in memory with a time-to-live.
+    Expired entries are dropped on access; the least recently used entry
+    is evicted once the cache is full.
+    """
+
+    __slots__ = ("_ttl", "_maxsize", "_entries", "_locks", "_waiters", "__weakref__")
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries kept
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        # Coroutines holding or waiting for each key's lock
+        self._waiters: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if present and not expired, None otherwise
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value under a key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_create(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Optional[Any]:
+        """
+        Get a cached value or create it with the given factory.
+
+        Concurrent misses for the same key wait for a single factory call
+        instead of each calling it. None results are not cached.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value
+
+        Returns:
+            Cached or newly created value, None if the factory failed
+
+        Example:
+            >>> cache = CacheService(ttl=60)
+            >>> await cache.get_or_create("rates", fetch_rates)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+
+        try:
+            async with lock:
+                value = self.get(key)
+                if value is None:
+                    value = await factory()
+                    if value is not None:
+                        self.set(key, value)
+                return value
+        finally:
+            # Drop the lock only once no coroutine holds or awaits it, so a
+            # later caller cannot start a second factory call alongside them
+            waiters = self._waiters[key] - 1
+            if waiters:
+                self._waiters[key] = waiters
+            else:
+                del self._waiters[key]
+                del self._locks[key]
@@ -2,6 +2,7 @@
 
 import json
 import os
+from typing import Any
 
 
 class FileService:
@@ -26,3 +27,35 @@ class FileService:
         file_path = os.path.join(module_path, "data", filename)
         with open(file_path, "r", encoding="utf-8") as f:
             return json.load(f)
+
+    @staticmethod
+    def read_json(file_path: str) -> Any:
+        """
+        Load and parse a JSON file from an arbitrary path.
+
+        Args:
+            file_path: Path of the JSON file to load
+
+        Returns:
+            The parsed JSON data
+
+        Example:
+            >>> history = FileService.read_json("/home/user/.numo_history")
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def write_json(file_path: str, data: Any) -> None:
+        """
+        Serialize data as JSON and write it to a path.
+
+        Args:
+            file_path: Path of the JSON file to write
+            data: JSON serializable data
+
+        Example:
+            >>> FileService.write_json("/home/user/.numo_history", ["2 + 2"])
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
@@ -0,0 +1,99 @@
+"""HTTP operations service for the Numo engine."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class HttpService:
+    """
+    Service for handling HTTP requests in the Numo engine.
+    Reuses a single client session so connections are kept alive between calls.
+    aiohttp is imported on first request, so engines that never go online
+    do not pay for loading it.
+    """
+
+    __slots__ = ("_session", "_loop", "__weakref__")
+
+    def __init__(self):
+        """Initialize without a session; it is created on first request."""
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get_json(
+        self, url: str, params: Optional[Dict[str, str]] = None
+    ) -> Optional[Any]:
+        """
+        Send a GET request and decode the JSON response.
+
+        Args:
+            url: Address to request
+            params: Optional query string parameters
+
+        Returns:
+            Decoded JSON data if successful
+            None: For any network error or non-200 response
+
+        Example:
+            >>> http = HttpService()
+            >>> data = await http.get_json("https://api.exchangerate-api.com/v4/latest/USD")
+        """
+        import aiohttp
+
+        try:
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    return None
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+
+    async def close(self) -> None:
+        """
+        Close the shared session and release its connections.
+
+        Call this on the event loop that made the requests. A session
+        created on a loop that has since closed is marked closed, but its
+        connections could not be shut down cleanly, and a session of a
+        loop that is open but not running is left as it is.
+        """
+        session, self._session = self._session, None
+        loop, self._loop = self._loop, None
+        if session is not None and loop is not None:
+            await self._close_session(session, loop)
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it for the running event loop."""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session is bound to the loop it was created on, so one left
+            # from another loop is closed before it is replaced
+            if self._session is not None and self._loop is not None:
+                await self._close_session(self._session, self._loop)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    async def _close_session(
+        session: "aiohttp.ClientSession", loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Close a session from the running loop, whichever loop created it."""
+        if session.closed:
+            return
+        if loop is asyncio.get_running_loop() or loop.is_closed():
+            # On a closed loop there is nothing left to wait for, so this
+            # only marks the session and its connector closed
+            await session.close()
+        elif loop.is_running():
+            # The owning loop runs in another thread
+            future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+            await asyncio.wrap_future(future)
+        # A session of an open but idle loop can only be closed on that loop
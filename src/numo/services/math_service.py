@@ -1,4 +1,49 @@
+import ast
 import re
+from math import isfinite
+from functools import lru_cache
+from types import CodeType
+from typing import Optional
+
+
+# Operators allowed in a mathematical expression
+_BINARY_OPERATORS = frozenset(
+    {ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow}
+)
+_UNARY_OPERATORS = frozenset({ast.UAdd, ast.USub})
+
+
+def _prepare_tree(tree: ast.Expression) -> bool:
+    """
+    Validate an expression tree and turn its integer literals into floats.
+
+    Uses a single iterative walk with an explicit stack.
+
+    Returns:
+        True if the tree only contains numbers and allowed operators
+    """
+    stack = [tree.body]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.BinOp:
+            if type(node.op) not in _BINARY_OPERATORS:
+                return False
+            stack.append(node.left)
+            stack.append(node.right)
+        elif node_type is ast.UnaryOp:
+            if type(node.op) not in _UNARY_OPERATORS:
+                return False
+            stack.append(node.operand)
+        elif node_type is ast.Constant:
+            value_type = type(node.value)
+            if value_type is int:
+                node.value = float(node.value)
+            elif value_type is not float:
+                return False
+        else:
+            return False
+    return True
 
 
 class MathService:
@@ -6,7 +51,7 @@ class MathService:
     Service class for handling mathematical operations.
     """
 
-    pattern = r"^[\d\s\+\-\*\/\(\)\^\%\.\,]+$"
+    pattern = re.compile(r"^[\d\s\+\-\*\/\(\)\^\%\.\,]+$")
 
     @staticmethod
     def safe_eval(expression: str) -> float:
@@ -14,9 +59,62 @@ class MathService:
         Safely evaluate a mathematical expression.
         """
         try:
-            if not re.match(MathService.pattern, expression):
+            return MathService._evaluate(expression)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def precompile(expression: str) -> bool:
+        """
+        Compile an expression ahead of time so its first evaluation is cached.
+
+        Returns:
+            True if the expression is a valid mathematical expression
+        """
+        return MathService._compile(expression) is not None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _evaluate(expression: str) -> Optional[float]:
+        """
+        Evaluate an expression once and cache its value.
+
+        Expressions only contain numeric literals and operators, so their
+        value never changes and repeated evaluations become a lookup.
+        """
+        try:
+            code = MathService._compile(expression)
+            if code is None:
                 return None
-            expression = expression.replace("^", "**")
-            return float(eval(expression, {"__builtins__": {}}, {}))
+            result = float(eval(code, {"__builtins__": {}}, {}))
+            # Overflowing products give inf or nan instead of raising
+            return result if isfinite(result) else None
         except:
             return None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compile(expression: str) -> Optional[CodeType]:
+        """
+        Validate and compile an expression once, so repeated evaluations
+        skip the pattern check, tokenizer and parser. Invalid expressions
+        are cached as None.
+
+        `^` is rewritten textually rather than on the syntax tree: Python
+        parses it as xor, which binds looser than `*` and groups left, so
+        only `**` keeps `2 * 3^2 == 18` and `2^3^2 == 512`.
+
+        Integer literals become floats, so an oversized power such as
+        `9^9^9` overflows immediately instead of building a huge integer.
+        The syntax tree is validated here too, so cached code is known safe.
+        """
+        if not MathService.pattern.match(expression):
+            return None
+
+        try:
+            tree = ast.parse(expression.replace("^", "**"), mode="eval")
+            if not _prepare_tree(tree):
+                return None
+            return compile(tree, "<expr>", "eval")
+        except (SyntaxError, ValueError, OverflowError):
+            return None
@@ -0,0 +1,111 @@
+"""On-disk caching service for the Numo engine."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class PersistentCacheService:
+    """
+    Service for caching text values in an SQLite file with a time-to-live.
+    Entries survive the process, so separate runs share them. Database
+    access runs in a worker thread to keep the event loop responsive;
+    database errors are treated as cache misses.
+    """
+
+    __slots__ = ("_path", "_ttl", "_connection", "_lock", "__weakref__")
+
+    def __init__(self, path: str, ttl: float):
+        """
+        Initialize without a connection; it is opened on first access.
+
+        Args:
+            path: SQLite database file, created if missing
+            ttl: Seconds an entry stays valid
+        """
+        self._path = path
+        self._ttl = ttl
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if present and not expired, None otherwise
+
+        Example:
+            >>> cache = PersistentCacheService("translations.db", ttl=3600)
+            >>> await cache.get("es:hello")
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store a value under a key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._set, key, value)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            connection, self._connection = self._connection, None
+            if connection is not None:
+                connection.close()
+
+    def _get(self, key: str) -> Optional[str]:
+        """Read a value that has not expired yet."""
+        with self._lock:
+            try:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                        (key, time.time()),
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str) -> None:
+        """Write a value, dropping expired entries along the way."""
+        now = time.time()
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "DELETE FROM cache WHERE expires_at <= ?", (now,)
+                    )
+                    connection.execute(
+                        "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                        (key, value, now + self._ttl),
+                    )
+            except sqlite3.Error:
+                pass
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection, opening it and creating the table if needed."""
+        if self._connection is None:
+            # Calls come from executor threads, serialized by the lock
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
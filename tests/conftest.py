@@ -0,0 +1,14 @@
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop instead of the default asyncio loop."""
+        return {"uvloop": uvloop.new_event_loop}
@@ -1,14 +1,25 @@
+import asyncio
+import gc
+import json
 import pytest
+import pytest_asyncio
+import weakref
+from typing import Optional
 from src.numo import Numo
+from numo.domain.interfaces.numo_module import NumoModule
+from numo.infrastructure.managers import VariableManager
+from numo.infrastructure.modules import TranslateModule
+from numo.services import CacheService, HttpService, PersistentCacheService
 
 
-@pytest.fixture
-def numo():
-    """Create a Numo instance for testing."""
-    return Numo()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def numo():
+    """Create a Numo instance shared by all tests and release its connections."""
+    async with Numo() as instance:
+        yield instance
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestNumo:
     """Test suite for Numo package."""
 
@@ -19,14 +30,83 @@ class TestNumo:
         assert float(results[1]) == 12.0
         assert float(results[2]) == 5.0
 
+    async def test_power_operator(self, numo):
+        """Test that ^ has exponent precedence and associativity."""
+        results = await numo.calculate(["2 ^ 3", "2 * 3^2", "2^3^2", "-2^2"])
+        assert float(results[0]) == 8.0
+        assert float(results[1]) == 18.0
+        assert float(results[2]) == 512.0
+        assert float(results[3]) == -4.0
+
     async def test_variables(self, numo):
         """Test variable operations."""
+        numo.reset_variables()
         results = await numo.calculate(["x = 5", "y = 3", "z = x + y", "z"])
         assert float(results[0]) == 5.0
         assert float(results[1]) == 3.0
         assert float(results[2]) == 8.0
         assert float(results[3]) == 8.0
 
+    async def test_walrus_assignment(self, numo):
+        """Test variable definitions using :=."""
+        numo.reset_variables()
+        results = await numo.calculate(["w := 2", "w * 3"])
+        assert float(results[0]) == 2.0
+        assert float(results[1]) == 6.0
+
+    async def test_variable_precedence(self, numo):
+        """Test that a variable holding an expression acts as one value."""
+        numo.reset_variables()
+        results = await numo.calculate(["x = 2 + 3", "x * 2", "y = x - 1", "2 ^ y"])
+        assert float(results[0]) == 5.0
+        assert float(results[1]) == 10.0
+        assert float(results[2]) == 4.0
+        assert float(results[3]) == 16.0
+
+        results = await numo.calculate(["n = 1 - 4", "n ^ 2"])
+        assert float(results[0]) == -3.0
+        assert float(results[1]) == 9.0
+
+        results = await numo.calculate(
+            ["s = 0.00001", "s * 100000", "t = 1 / 3000000", "t * 3000000"]
+        )
+        assert float(results[1]) == 1.0
+        assert float(results[3]) == 1.0
+
+    async def test_variable_function_arguments(self, numo):
+        """Test that whole-number variables work as integer arguments."""
+        numo.reset_variables()
+        results = await numo.calculate(
+            ["n = 5", "fact(n)", "gcd(n, 10)", "c = 3", "combination(n, c)"]
+        )
+        assert float(results[1]) == 120.0
+        assert float(results[2]) == 5.0
+        assert float(results[4]) == 10.0
+
+    async def test_translation_text_unchanged(self):
+        """Test that words joined by "-", "." or "'" are not substituted."""
+        manager = VariableManager()
+        manager.build("x = 5")
+        for source in ["e-mail in french", "e.g. in spanish", "pi-hole in german"]:
+            assert manager.build(source) == source
+        assert manager.build("x-1") == "5-1"
+
+    async def test_operator_aliases(self, numo):
+        """Test word aliases for mathematical operators."""
+        results = await numo.calculate(
+            [
+                "2 plus 3",
+                "5 minus 2",
+                "4 times 2",
+                "10 divide 2",
+                "10 mod 3",
+                "2 power 3",
+                "3 PLUS 4",
+            ]
+        )
+        expected = [5.0, 3.0, 8.0, 5.0, 1.0, 8.0, 7.0]
+        assert [float(result) for result in results] == expected
+
     async def test_functions(self, numo):
         """Test mathematical functions."""
         results = await numo.calculate(["abs(-5)", "sqrt(16)", "pow(2, 3)"])
@@ -40,6 +120,23 @@ class TestNumo:
         assert float(results[0]) == 1000.0
         assert float(results[1]) == 1.0
 
+    async def test_raw_results(self, numo):
+        """Test unformatted numeric results."""
+        numo.reset_variables()
+        results = await numo.calculate(
+            ["10 / 3", "x = 1 / 3", "1 km to cm", "invalid"], raw=True
+        )
+        assert results[0] == pytest.approx(10 / 3)
+        assert results[1] == pytest.approx(1 / 3)
+        assert results[2].value == pytest.approx(100000.0)
+        assert results[2].unit == "cm"
+        assert results[3] is None
+
+        results = await numo.calculate(["x = 0", "0 * 5", "0 km to m"], raw=True)
+        assert results[0] == 0.0
+        assert results[1] == 0.0
+        assert results[2].value == 0.0
+
     async def test_empty_and_invalid_input(self, numo):
         """Test handling of empty and invalid input."""
         results = await numo.calculate(
@@ -56,7 +153,133 @@ class TestNumo:
                 "sqrt(-1)",  # Invalid math operation
                 "invalid in spanish",  # Invalid translation
                 "abc to xyz",  # Invalid unit conversion
+                "9^9^9",  # Power too large to evaluate
             ]
         )
-        assert len(results) == 4
+        assert len(results) == 5
         assert all(result is None for result in results)
+
+    async def test_weak_reference(self, numo):
+        """Test that the engine supports weak references."""
+        assert weakref.ref(numo)() is numo
+
+    async def test_non_string_input(self, numo):
+        """Test that non-string lines are rejected up front."""
+        with pytest.raises(TypeError):
+            await numo.calculate(["2 + 2", 5])
+
+    async def test_failing_module(self):
+        """Test that a module raising an exception does not break other lines."""
+
+        class FailingModule(NumoModule):
+            async def run(self, source: str) -> Optional[str]:
+                raise RuntimeError("module failure")
+
+        # Use a separate engine so the failing module does not leak into
+        # the shared fixture
+        async with Numo() as numo:
+            numo.add_module(FailingModule())
+            results = await numo.calculate(["2 + 2", "anything"])
+        assert float(results[0]) == 4.0
+        assert results[1] is None
+
+    async def test_lower_priority_module_cancelled(self):
+        """Test that a winning module does not wait for later modules."""
+
+        class HangingModule(NumoModule):
+            cancelled = 0
+
+            async def run(self, source: str) -> Optional[str]:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    HangingModule.cancelled += 1
+                    raise
+
+        async with Numo() as numo:
+            numo.add_module(HangingModule())
+            results = await asyncio.wait_for(
+                numo.calculate(["2 + 2", "1 km to m"]), timeout=1
+            )
+            await asyncio.sleep(0)
+        assert float(results[0]) == 4.0
+        assert float(results[1]) == 1000.0
+        assert HangingModule.cancelled == 2
+
+    async def test_reset_variables(self, numo):
+        """Test that resetting removes user variables but keeps constants."""
+        await numo.calculate(["v = 7"])
+        numo.reset_variables()
+        results = await numo.calculate(["v", "2 * pi"])
+        assert results[0] is None
+        assert float(results[1]) == 6.28
+
+    async def test_history_file(self, tmp_path):
+        """Test that history is written on close without pinning the engine."""
+        path = str(tmp_path / "history.json")
+        async with Numo(history_file=path) as numo:
+            await numo.calculate(["2 + 2", "x = 5"])
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == ["2 + 2"]
+
+        engine = weakref.ref(numo)
+        del numo
+        gc.collect()
+        assert engine() is None
+
+    async def test_translation_cache_file(self, tmp_path):
+        """Test that stored translations are reused without the network."""
+
+        class FakeHttpService:
+            calls = 0
+
+            async def get_json(self, url, params=None):
+                FakeHttpService.calls += 1
+                return [[["hola", params["q"]]]]
+
+        path = str(tmp_path / "translations.db")
+        for _ in range(2):
+            # A fresh module and store act like a new process
+            store = PersistentCacheService(path, ttl=60)
+            module = TranslateModule(FakeHttpService(), store)
+            assert await module.run("hello in spanish") == "hola"
+            store.close()
+        assert FakeHttpService.calls == 1
+
+
+def test_http_session_replaced_across_event_loops():
+    """Test that a session left on a finished event loop is closed when replaced."""
+    http = HttpService()
+    first = asyncio.run(http._get_session())
+    second = asyncio.run(http._get_session())
+    assert first is not second
+    assert first.closed
+    asyncio.run(http.close())
+    assert second.closed
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight_with_late_caller():
+    """Test that a caller arriving during a lock handoff waits its turn."""
+    cache = CacheService(ttl=60)
+    running = 0
+    overlaps = 0
+    tasks = []
+
+    async def factory():
+        nonlocal running, overlaps
+        running += 1
+        overlaps = max(overlaps, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if not tasks:
+            # Arrives after this call releases the lock but before the
+            # waiting caller takes it
+            tasks.append(asyncio.ensure_future(cache.get_or_create("key", factory)))
+        return None
+
+    await asyncio.gather(
+        cache.get_or_create("key", factory), cache.get_or_create("key", factory)
+    )
+    await tasks[0]
+    assert overlaps == 1